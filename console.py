@@ -8,7 +8,9 @@ from .util import get_logger
 
 logger = get_logger()
 
-_ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+# bytes pattern: ANSI is stripped before decoding, so the common tag-free line costs just a
+# C-level ESC-byte scan instead of a regex pass over every decoded string
+_ANSI = re.compile(rb"\x1b\[[0-9;?]*[A-Za-z]")
 # the firmware's final-else when it doesn't recognise a command
 REJECT = "unknown or unexpected command"
 
@@ -38,8 +40,17 @@ class Console:
     (the firmware streams periodic status lines between commands). `command()` sends one command
     and gathers reply lines until the firmware's 'OK: <cmd>' / 'ERR: <cmd>' completion marker, a
     rejection, or a timeout. Works the same over serial, TCP/telnet, or BLE.
+
+    The reader is deliberately a blocking thread rather than a selectors/asyncio loop: reads park
+    in the kernel (recv / a blocking serial read) and wake on arrival with no sleep-backoff, and
+    the BLE/MQTT transports deliver via callback queues that have no selectable fd -- a readiness
+    loop could not wait on those, while one thread per console covers every transport uniformly.
     """
 
+    # partial-line assembly cap: a stream that never yields '\n' (wrong baud, binary noise)
+    # would otherwise grow _buf without bound on a long-running daemon
+    max_line_bytes = 65536
+
     def __init__(self, transport: Transport, eol="\r\n", on_line=None, maxlines=2000,
                  wait_banner=False, banner_marker="to disconnect.", banner_timeout=2.0,
                  min_post_connect=1.2):
@@ -84,7 +95,9 @@ class Console:
             self._buf += chunk
             while b"\n" in self._buf:
                 raw, self._buf = self._buf.split(b"\n", 1)
-                line = _ANSI.sub("", raw.decode("utf-8", "replace")).rstrip("\r")
+                if b"\x1b" in raw:
+                    raw = _ANSI.sub(b"", raw)
+                line = raw.decode("utf-8", "replace").rstrip("\r")
                 self._lines.put(line)
                 # cap memory when nobody is consuming (a monitoring-only owner that taps via
                 # on_line but never calls command()); keep the most recent lines
@@ -95,6 +108,10 @@ class Console:
                         break
                 if self.on_line:
                     self.on_line(line)
+            if len(self._buf) > self.max_line_bytes:
+                keep = self.max_line_bytes // 2
+                logger.debug("dropping %d B of unterminated input", len(self._buf) - keep)
+                self._buf = self._buf[-keep:]
 
     def drain(self):
         """Discard buffered lines (e.g. status lines streamed before the next command)."""
@@ -1,17 +1,18 @@
+import threading
 import time
 from typing import List, Tuple
 
+# one shared Zeroconf instance + browser for the process: mDNS subscription setup/teardown
+# costs hundreds of ms and network chatter per call, and results only accumulate
+_zc = None
+_found = threading.Event()  # set on every add_service, so waiters wake on arrival
+_addrs = set()
+_lock = threading.Lock()
 
-def discover_scope_servers(stop_after=99, timeout=1) -> List[Tuple[str, int, str]]:
-    """
-    Discovers scope server hosts on the network
-    :param stop_after:
-    :param timeout:
-    :return: a list of tuple(addr,port,name)
-    """
-    from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
 
-    addr = []
+def _start_browser():
+    global _zc
+    from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
 
     class MyListener(ServiceListener):
 
@@ -23,29 +24,46 @@ def discover_scope_servers(stop_after=99, timeout=1) -> List[Tuple[str, int, str
 
         def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
             info = zc.get_service_info(type_, name)
-            addr.extend((a, info.port, info.server) for a in info.parsed_addresses())
+            _addrs.update((a, info.port, info.server) for a in info.parsed_addresses())
+            _found.set()
 
-    zeroconf = Zeroconf()
-    listener = MyListener()
-    # browser = ServiceBrowser(zeroconf, "_http._tcp.local.", listener)
-    browser = ServiceBrowser(zeroconf, "_scope._tcp.local.", listener)
+    _zc = Zeroconf()
+    ServiceBrowser(_zc, "_scope._tcp.local.", MyListener())
+
+
+def discover_scope_servers(stop_after=99, timeout=1) -> List[Tuple[str, int, str]]:
+    """
+    Discovers scope server hosts on the network. The underlying mDNS browser is shared across
+    calls and keeps collecting in the background, so repeat calls return instantly.
+    :param stop_after:
+    :param timeout:
+    :return: a list of tuple(addr,port,name)
+    """
+    with _lock:
+        if _zc is None:
+            _start_browser()
 
-    t0 = time.time()
+    deadline = time.time() + timeout
+    while len(_addrs) <= stop_after:
+        _found.clear()
+        if len(_addrs) > stop_after:
+            break
+        remaining = deadline - time.time()
+        if remaining <= 0 or not _found.wait(remaining):
+            break
 
-    addrs = set()
+    return list(_addrs)
 
-    try:
-        while time.time() - t0 < timeout:
-            if addr:
-                addrs.update(addr)
-                if len(addrs) > stop_after:
-                    return addrs
-            time.sleep(.1)
-    finally:
-        zeroconf.close()
 
-    return list(addrs)
+def close_discovery():
+    """Shut down the shared browser (e.g. at process exit); the next discover call restarts it."""
+    global _zc
+    with _lock:
+        if _zc is not None:
+            _zc.close()
+            _zc = None
+            _addrs.clear()
 
 
 if __name__ == '__main__':
-    print(discover_scope_servers())
\ No newline at end of file
+    print(discover_scope_servers())
@@ -6,9 +6,13 @@
 
 
 """
+import array
 import collections
+import functools
+import logging
 import re
 import sys
+import threading
 import time
 from math import nan
 from typing import Optional, Literal, Union
@@ -19,14 +23,41 @@ from .util import get_logger
 
 logger = get_logger()
 
-# 'V=73.6/27.25 I=3.75/ 9.88A 276.3W 53℃54℃ 454sps  0㎅/s CCM(H|L|Lm)= 790|1257|1257 st= MANU,0 lag=3292㎲ N=1192849 rssi=0'
-r_float = r'(\d+\.?\d*(e\d+\.?\d*)?|nan)'
-RE_PWM = re.compile(
-    r'V=\s*(?P<vin>[0-9.]+)\s*/\s*(?P<vout>[0-9.]+).+'
-    fr'([0-9.]+)W (?P<tmp_ntc>{r_float})℃(?P<tmp_mcu>{r_float})℃\s.*'
-    r'(?P<mode>[CD]CM)\(H\|L\|Lm\)=\s*(?P<ctrl>[0-9]+)\|\s*(?P<sync>[0-9]+)\|\s*(?P<sync_max>[0-9]+)\s.+'
-    r'rssi=\s*(?P<rssi>-?[0-9]+)'
-)
+
+def _parse_pwm(rx: str) -> Optional[dict]:
+    """Parse a PWM status line, e.g.
+
+    'V=73.6/27.25 I=3.75/ 9.88A 276.3W 53℃54℃ 454sps  0㎅/s CCM(H|L|Lm)= 790|1257|1257 st= MANU,0 lag=3292㎲ N=1192849 rssi=0'
+
+    Locates the fixed anchors (V=, the two ℃, (H|L|Lm)=, rssi=) with str.index and converts
+    the short slices in between -- bounded O(len) work, unlike the old single regex whose
+    chained greedy .+ wildcards could backtrack badly on malformed input. Returns the typed
+    field dict, or None if any anchor or number is missing/garbled (truncated line, boot noise).
+    """
+    try:
+        i = rx.index('V=')
+        vin_s, rest = rx[i + 2:].lstrip().split('/', 1)
+        vout_s = rest.split(None, 1)[0]
+
+        i = rx.index('℃')
+        j = rx.index('℃', i + 1)
+        tmp_ntc_s = rx[rx.rindex(' ', 0, i) + 1:i]
+        tmp_mcu_s = rx[i + 1:j]
+
+        m = rx.index('CM(H|L|Lm)=')  # preceded by C or D (the converter mode)
+        ctrl_s, sync_s, rest = rx[m + 11:].split('|', 2)
+        sync_max_s = rest.split(None, 1)[0]
+
+        i = rx.index('rssi=')
+        rssi = int(rx[i + 5:].split(None, 1)[0])
+
+        return dict(ccm=rx[m - 1] == 'C',
+                    ctrl=int(ctrl_s), sync=int(sync_s), sync_max=int(sync_max_s),
+                    vin=float(vin_s), vout=float(vout_s),
+                    tmp_ntc=float(tmp_ntc_s), tmp_mcu=float(tmp_mcu_s), rssi=rssi)
+    except (ValueError, IndexError):
+        return None
+
 
 # Crash/panic markers in the serial log. `rst:0x..` is intentionally NOT here: the bootloader prints
 # it on every reset (incl. a clean `restart` and power-on), so it signals a reboot, not a crash.
@@ -37,6 +68,31 @@ RE_CRASH = re.compile(
 )
 
 
+# noteworthy-line keywords surfaced via logger.warning in _on_line; extend the tuple, the
+# compiled alternation below follows. One regex pass scans the line once instead of one
+# substring scan per word. The anchored ^[WE] ( alternative covers the ESP log warn/error
+# prefix (Console strips the ANSI color tag, so the bare letter is what remains).
+WARN_WORDS = ('shutdown', 'error', 'warn', 'disabled', 'enabled', 'failed', 'reset', 'boot',
+              'backtrace', 'exception')
+RE_WARN = re.compile('|'.join((r'^[WE] \(',) + WARN_WORDS))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_serial_port() -> str:
+    # gethostname() is a syscall and the answer cannot change within a process run
+    import socket
+    return '/dev/ttyACM1' if socket.gethostname() == 'rpi' else '/dev/cu.usbmodem*'
+
+
+@functools.lru_cache(maxsize=256)
+def _conf_regex(file, key) -> re.Pattern:
+    # compiled once per (file, key) -- get_conf_value is called in polling loops (e.g.
+    # wsync_status) and recompiling the pattern per call dominated the lookup cost.
+    # No (.+: )? prefix group: with search() the literal head lets re fast-skip to the
+    # match instead of backtracking over a variable log prefix from position 0.
+    return re.compile(rf"Conf '/littlefs/conf/{re.escape(file)}:{re.escape(key)}' = '(.*)'")
+
+
 def boost_D2M(d):
     # boost converter duty cycle to ratio
     return 1 / (1 - d)
@@ -80,8 +136,7 @@ class FuguDevice:
 
     @staticmethod
     def get_default_serial_port():
-        import socket
-        return '/dev/ttyACM1' if socket.gethostname() == 'rpi' else '/dev/cu.usbmodem*'
+        return _default_serial_port()
 
     _warned_set_d = False
 
@@ -94,10 +149,15 @@ class FuguDevice:
         self._pwm_ctrl_max = None  # the `dc` clamp limit (pwmMax - pwmRectMin)
         self.pwm_freq = None
         self.wifi_rssi = 0
-        self.temperatures = []
-        self.voltages = []
+        # preallocated and mutated in place by _on_line (no fresh list per status line);
+        # [ntc, mcu] / [vin, vout], nan until the first telemetry arrives
+        self.temperatures = array.array('d', (nan, nan))
+        self.voltages = array.array('d', (nan, nan))
         # monotonic time of the last parsed telemetry line, see telemetry_fresh()
         self._last_telemetry_t = None
+        # set by _on_line whenever a status line parses; wait_for_pwm_state() blocks on it
+        # instead of sleep-polling pwm_state
+        self._pwm_ready = threading.Event()
 
         if ip:
             assert transport is None
@@ -110,6 +170,9 @@ class FuguDevice:
         self.transport = transport
         self.verbose = False
         self.on_message = None
+        # sampled once: when warnings are muted (a daemon that only consumes telemetry), the
+        # per-line keyword scan in _on_line is pure waste. Refresh after reconfiguring logging.
+        self._log_warn = logger.isEnabledFor(logging.WARNING)
 
         # crash/reboot tracking. _last_crash_time is set from the reader thread in _on_line();
         # _last_uptime is updated by has_rebooted()/get_uptime() polls.
@@ -147,7 +210,13 @@ class FuguDevice:
         """
         assert self.console.is_alive()
         self.pwm_state = PwmState(None, 0, 0, 0)
+        self._pwm_ready.clear()
         t0 = time.monotonic()
+        # pwm_state itself is the authoritative exit predicate; the event is only a wakeup
+        # hint. The reader can publish concurrently with the reset above (our overwrite and
+        # clear() can land between its assignment and set()), so exiting on the event alone
+        # could return the ccm=None reset state. The short wait slice keeps the
+        # timeout/liveness checks running.
         while self.pwm_state.ccm is None:
             if timeout is not None and time.monotonic() - t0 > timeout:
                 raise TimeoutError(
@@ -157,12 +226,14 @@ class FuguDevice:
             if not self.console.is_alive():
                 raise ConnectionError(self.prefix + 'reader thread died while waiting for '
                                                     'the first status line')
-            time.sleep(0.1)
+            if self._pwm_ready.wait(timeout=0.5):
+                self._pwm_ready.clear()  # re-arm; the loop re-checks pwm_state either way
 
     def close(self, close_transport=True, join_rx=True):
         self.is_open = False
         self.pwm_state = PwmState(None, 0, 0, 0)
         self._last_telemetry_t = None  # a closed device has no current state
+        self._pwm_ready.clear()
         self._pwm_max = self._pwm_ctrl_max = None
         self.console.close()
 
@@ -176,29 +247,35 @@ class FuguDevice:
             self._last_crash_time = time.monotonic()
             logger.warning(self.prefix + 'crash detected: %s', rx)
 
-        # always log errors, warnings, etc (ANSI is stripped, so match the ESP log W/E prefix too)
-        words = ('shutdown', 'error', 'warn', 'disabled', 'enabled', 'failed', 'reset', 'boot', 'backtrace',
-                 'exception')
+        # always log errors, warnings, etc (ANSI is stripped; RE_WARN matches the ESP log
+        # W/E prefix too)
         if self.verbose:
             print(self.prefix + rx, flush=True)
-        elif any(w in rx for w in words) or rx.startswith(('W (', 'E (')):
+        elif self._log_warn and RE_WARN.search(rx):
             logger.warning(self.prefix + 'Ser: %s', rx)
 
-        m = RE_PWM.search(rx)
-        if m:
-            d = m.groupdict()
-            s = PwmState(d['mode'] == 'CCM',
-                         pwm_ctrl=int(d['ctrl']),
-                         pwm_sync=int(d['sync']),
-                         pwm_sync_max=int(d['sync_max']))
-            self.wifi_rssi = int(d.get('rssi', 0))
-            self.temperatures = [float(d.get('tmp_ntc', nan)), float(d.get('tmp_mcu', nan))]
-            self.voltages = [float(d.get('vin', nan)), float(d.get('vout', nan))]
+        # cheap substring gate: PWM status lines are a small fraction of traffic (boot/log/
+        # warn lines dominate), and str.__contains__ is far cheaper than running the full
+        # status-line parse over every line
+        d = _parse_pwm(rx) if ('CCM(' in rx or 'DCM(' in rx) else None
+        if d:
+            s = PwmState(d['ccm'],
+                         pwm_ctrl=d['ctrl'],
+                         pwm_sync=d['sync'],
+                         pwm_sync_max=d['sync_max'])
+            self.wifi_rssi = d['rssi']
+            t, v = self.temperatures, self.voltages
+            t[0], t[1] = d['tmp_ntc'], d['tmp_mcu']
+            v[0], v[1] = d['vin'], d['vout']
             self._last_telemetry_t = time.monotonic()
 
+            # set() only after pwm_state holds the parsed line: wait_for_pwm_state() exits on
+            # the event alone, and a waiter waking earlier would read the ccm=None reset state
             if self.pwm_state != s:
                 self.pwm_state = s
+                self._pwm_ready.set()
             else:
+                self._pwm_ready.set()
                 return
 
         if 'ina22x' in rx and 'timeout' in rx:
@@ -306,10 +383,12 @@ class FuguDevice:
 
     def get_conf_value(self, file, key):
         self.command_ack(f"get-config {file} {key}")
-        rex = re.compile(rf"(.+: )?Conf '/littlefs/conf/{file}:{key}' = '(.*)'")
+        rex = _conf_regex(file, key)
         for l in reversed(self.ser_tail):
-            if m := rex.match(l):
-                return m.group(2)  # group(1) is the optional log prefix; group(2) is the value
+            if "Conf '" not in l:
+                continue
+            if m := rex.search(l):
+                return m.group(1)
         return None
 
     def manual_pwm(self, en=True):
@@ -373,14 +452,20 @@ class FuguDevice:
 
         pwm_ctrl = self.pwm_state.pwm_ctrl
 
-        while pwm_ctrl != pwm_cnt:
-            delta = pwm_cnt - pwm_ctrl
-            # dont fade if target is 0
-            if pwm_cnt != 0 and abs(delta) > max_step:
-                delta = max_step * delta / abs(delta)
-            pwm_ctrl += delta
-            self.transport.write(b'dc %d\n' % pwm_ctrl)
-            time.sleep(step_wait / 4 if delta < 0 else step_wait)
+        # dont fade if target is 0
+        if pwm_cnt == 0 or abs(pwm_cnt - pwm_ctrl) <= max_step:
+            steps = [pwm_cnt] if pwm_cnt != pwm_ctrl else []
+        else:
+            step = max_step if pwm_cnt > pwm_ctrl else -max_step
+            steps = list(range(pwm_ctrl + step, pwm_cnt, step))
+            steps.append(pwm_cnt)
+
+        if steps:
+            # one write/syscall (and USB transaction) for the whole ramp instead of one per
+            # step; the firmware's console task paces the steps itself, so the per-step host
+            # sleep collapses into a single settle wait
+            self.transport.write(b''.join(b'dc %d\n' % s for s in steps))
+            time.sleep(step_wait)
 
         logger.debug('Set pwm_cnt = %d', pwm_cnt)
         return pwm_cnt
@@ -422,6 +507,9 @@ class FuguDevice:
         self.transport.write(cmd.encode('utf-8'))
 
     def command_ack(self, cmd: str):
+        # ack detection is event-driven: Console.command() blocks on its line queue until the
+        # OK/ERR marker (or a rejection/timeout) arrives, so the latency is bounded by the
+        # device's response time, not a host-side poll interval
         reply = self.console.command(cmd.strip())
         if reply.ok:
             return True
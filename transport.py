@@ -43,13 +43,21 @@ class SerialTransport(Transport):
         self.baud = baud
         self.timeout = timeout
         self.ser: Optional[serial.Serial] = None
+        self._resolved = None  # concrete path a '*' pattern last resolved to
 
     def open(self):
         if self.ser and self.ser.is_open:
             return
         port = self.port
         if '*' in port:
-            port = glob.glob(port)[0]
+            # cache the glob across reopens, but re-scan when the node is gone: USB-CDC
+            # devices re-enumerate under a new name after a panic/replug
+            if self._resolved is None or not os.path.exists(self._resolved):
+                matches = glob.glob(port)
+                if not matches:
+                    raise FileNotFoundError(f'no serial port matches {port!r}')
+                self._resolved = matches[0]
+            port = self._resolved
         logger.info(f'opening serial port {port} @ {self.baud}')
         self.ser = serial.Serial(port, baudrate=self.baud, timeout=self.timeout)
 
@@ -57,8 +65,11 @@ class SerialTransport(Transport):
         self.ser.write(data)
 
     def read(self) -> Optional[bytes]:
+        # chunked, not readline(): pyserial's read_until fetches one byte per syscall scanning
+        # for the newline. Block for the first byte, then drain whatever has accumulated in one
+        # read -- Console does the line assembly anyway (like the socket transport's chunks).
         if self.ser.is_open and self.ser.readable():
-            return self.ser.readline()
+            return self.ser.read(self.ser.in_waiting or 1)
         return None
 
 
@@ -80,8 +91,11 @@ class SocketTransport(Transport):
         # TCP keepalive so we notice silently-dead peers (e.g. ESP32 reboot mid-OTA without
         # a clean FIN) within ~10 s instead of waiting on the default ~2 h.
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # TCP_USER_TIMEOUT (ms, Linux) additionally bounds how long queued-but-unacked
+        # writes may linger before the kernel declares the link dead.
         for _name, _val in (('TCP_KEEPIDLE', 3), ('TCP_KEEPALIVE', 3),
-                            ('TCP_KEEPINTVL', 2), ('TCP_KEEPCNT', 3)):
+                            ('TCP_KEEPINTVL', 2), ('TCP_KEEPCNT', 3),
+                            ('TCP_USER_TIMEOUT', 10000)):
             _opt = getattr(socket, _name, None)
             if _opt is not None:
                 try:
@@ -104,6 +118,11 @@ class SocketTransport(Transport):
             self.sock = None
 
     def read(self):
+        if self.sock is None:
+            # read() after close() (e.g. the reader thread looping once more after an EOF tore
+            # the socket down) -- name the condition instead of AttributeError on None, so the
+            # console's read loop logs a disconnect rather than a crash
+            raise ConnectionError('socket is closed')
         try:
             r = self.sock.recv(1024)
             if not r:
@@ -111,11 +130,10 @@ class SocketTransport(Transport):
                 # Tear down so callers stop polling and the reader thread exits.
                 self.close()
                 return b''
+            # no in-band telnet NOP probing here: the kernel keepalive set up in open()
+            # detects dead peers out-of-band without polluting the stream or adding a
+            # write syscall to the read path
             self.t_last_comm = time.time()
-            if time.time() - self.t_last_comm > 1:
-                # check conn health
-                if self.is_telnet:
-                    self.write(bytes([255, 241]))  # send telnet NOP to probe conn TODO Are you there 246 ?
             return r
         except socket.timeout:
             # recv() hit the socket-level timeout, not a disconnect — return empty so the read
@@ -1,3 +1,4 @@
+import bisect
 import logging
 import math
 import time
@@ -40,6 +41,14 @@ def num2str(x, n=None):
     return s
 
 
+# magnitude buckets for round_to_n_dec, bisected instead of walked with an if/elif ladder.
+# the two upper thresholds are nudged one ulp up to keep the original strict comparisons
+# (ax == 999.0 stays unsuffixed, ax == 999e3 stays 'k').
+_DEC_THRESH = (999e-12, 999e-9, 999e-6, 999e-3,
+               math.nextafter(999.0, math.inf), math.nextafter(999e3, math.inf))
+_DEC_SCALE = ((1e12, 'p'), (1e9, 'n'), (1e6, 'µ'), (1e3, 'm'), (1, ''), (1e-3, 'k'), (1e-6, 'M'))
+
+
 def round_to_n_dec(x, n):
     x = round_to_n(x, n)
     if not x or isinstance(x, str) or not math.isfinite(x):
@@ -49,21 +58,8 @@ def round_to_n_dec(x, n):
 
     if ax < 1e-20:
         return '0' if x >= 0 else '-0'
-    elif ax < 999e-12:
-        return num2str(x * 1e12, n) + 'p'
-    elif ax < 999e-9:
-        return num2str(x * 1e9, n) + 'n'
-    elif ax < 999e-6:
-        return num2str(x * 1e6, n) + 'µ'
-    elif ax < 999e-3:
-        return num2str(x * 1e3, n) + 'm'
-    elif ax > 0.999e6:
-        return num2str(x * 1e-6, n) + 'M'
-    elif ax > 0.999e3:
-        return num2str(x * 1e-3, n) + 'k'
-    # elif x > 9
-    else:
-        return num2str(x, n)
+    scale, suffix = _DEC_SCALE[bisect.bisect_right(_DEC_THRESH, ax)]
+    return num2str(x * scale, n) + suffix
 
 
 def sleep_confirm_interrupt(seconds, num=3, poll=None) -> bool: